@@ -1,4 +1,4 @@
-from ._autograd import eval, device, build_lock
+from ._autograd import eval, device, build_lock, compile_mode, set_build_lock
 
 def __print_init_message():
     from magnet.utils.misc import in_notebook
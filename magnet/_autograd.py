@@ -1,12 +1,63 @@
+import os
 import torch
+import warnings
 
 from contextlib import contextmanager
 
+def _set_cuda_alloc_conf():
+    # Nodes are built lazily and may see many different shapes.
+    # Expandable segments keep the caching allocator from fragmenting.
+    # The allocator reads this only once, when CUDA is initialized.
+    # Leave it alone if the user configured it under any of its names.
+    if any(name in os.environ for name in _ALLOC_CONFS): return
+
+    conf = os.environ.get('MAGNET_ALLOC_CONF')
+    if conf is None:
+        # Older allocators reject the unknown option
+        if _torch_version() < (2, 1): return
+        conf = 'expandable_segments:True'
+
+    is_initialized = getattr(torch.cuda, 'is_initialized', lambda: torch.cuda._initialized)
+    if is_initialized():
+        if 'MAGNET_ALLOC_CONF' in os.environ:
+            warnings.warn('CUDA was initialized before importing MagNet. '
+                          'MAGNET_ALLOC_CONF will not take effect.')
+        return
+
+    os.environ['PYTORCH_CUDA_ALLOC_CONF'] = conf
+
+_ALLOC_CONFS = ('PYTORCH_ALLOC_CONF', 'PYTORCH_CUDA_ALLOC_CONF', 'PYTORCH_HIP_ALLOC_CONF')
+
+def _torch_version():
+    return tuple(int(v) for v in torch.__version__.split('+')[0].split('.')[:2])
+
+_set_cuda_alloc_conf()
+
 device = 'cuda' if torch.cuda.is_available() else 'cpu'
 device = torch.device(device)
 
 build_lock = True
 
+# If set, Nodes compile themselves with nn.Module.compile()
+# in this mode when built. eg. 'default', 'reduce-overhead'
+# Needs PyTorch 2.2 or above.
+compile_mode = None
+
+def set_build_lock(lock=True):
+    r"""Sets ``mag.build_lock`` and updates all existing Nodes accordingly.
+
+    While the lock is off, Nodes rebuild themselves on every call.
+
+    Args:
+        lock (bool): Whether to lock the Nodes once built. Default: ``True``
+    """
+    global build_lock
+    import magnet as mag
+    from magnet.nodes.nodes import Node
+
+    build_lock = mag.build_lock = lock
+    for node in Node._instances: node._fast = lock and node._built
+
 def eval(*modules):
     r"""A Context Manger that makes it easy to run
     computations in ``eval`` mode.
@@ -2,8 +2,20 @@
 import torch.nn.functional as F
 
 from torch import nn
+from numpy import prod
 
 from .nodes import Node
+from magnet.nodes.functional import wiki
+
+# Conv layers for inputs with 1, 2 and 3 spatial dimensions
+_CONV_LAYERS = (nn.Conv1d, nn.Conv2d, nn.Conv3d)
+
+# BatchNorm layers for inputs with 0 to 3 spatial dimensions.
+# Both (N, C) and (N, C, L) inputs use BatchNorm1d.
+_BATCH_NORM_LAYERS = (nn.BatchNorm1d, nn.BatchNorm1d, nn.BatchNorm2d, nn.BatchNorm3d)
+
+# Recurrent layers by the (lowercase) name given to RNN
+_RNN_LAYERS = {'rnn': nn.RNN, 'lstm': nn.LSTM, 'gru': nn.GRU}
 
 class Lambda(Node):
     r"""Wraps a Node around any function.
@@ -36,8 +48,10 @@ class Lambda(Node):
 
         # If a name is not supplied, get the function name instead
         # of the class (Lambda) name.
+        # Callables like partials or callable objects have no __name__.
         if self.name == self.__class__.__name__:
-            self.name = self._args['fn'].__name__
+            fn = self._args['fn']
+            self.name = getattr(fn, '__name__', type(fn).__name__)
 
     def forward(self, *args, **kwargs):
         return self._args['fn'](*args, **kwargs)
@@ -152,8 +166,6 @@ class Conv(Node):
         super().__init__(c, k, p, s, d, g, b, ic, act, bn, **kwargs)
 
     def build(self, x):
-        from magnet.nodes.functional import wiki
-
         self._set_padding(x) # Handle 'half', 'same' and 'double' padding
 
         # Infer the input shape if not given
@@ -181,28 +193,26 @@ class Conv(Node):
 
     @staticmethod
     def _find_layer(x):
-        shape_dict = [nn.Conv1d, nn.Conv2d, nn.Conv3d]
         ndim = len(x.shape) - 2
-        return shape_dict[ndim - 1]
+        return _CONV_LAYERS[ndim - 1]
 
     def _set_padding(self, x):
         in_shape = x.shape
 
         p = self._args['p']
 
-        if p == 'half': f = 0.5
-        elif p == 'same': f = 1
+        # The stride which gives the required scaling
+        if p == 'half': s = 2
+        elif p == 'same': s = 1
         elif p == 'double':
             self._upsample = 2
             if self._args['c'] is None:
                 self._args['c'] = in_shape[1] // 2
-            f = 1
+            s = 1
         else: return
 
-        s = 1 / f
-
         self._args['d'] = 1
-        self._args['s'] = int(s)
+        self._args['s'] = s
         self._args['p'] = int(self._args['k'] // 2)
         if self._args['c'] is None:
             self._args['c'] = self._args['s'] * in_shape[1]
@@ -319,9 +329,6 @@ class Linear(Node):
         super().__init__(o, b, flat, i, act, bn, **kwargs)
 
     def build(self, x):
-        from numpy import prod
-        from magnet.nodes.functional import wiki
-
         # Infer the input shape if not given
         if self._args['i'] is None: self._args['i'] = prod(x.shape[1:]) if self._args['flat'] else x.shape[-1]
 
@@ -334,7 +341,7 @@ class Linear(Node):
 
         self._activation = wiki['activations'][self._args['act']]
 
-        self.layer = nn.Linear(*[self._args[k] for k in ('i', 'o', 'b')])
+        self.layer = nn.Linear(self._args['i'], self._args['o'], self._args['b'])
 
         if self._args['bn']: self._batch_norm = BatchNorm()
 
@@ -370,7 +377,7 @@ class _RNNBase(Node):
         # Infer the input shape if not given
         if self._args['i'] is None: self._args['i'] =  x.shape[-1]
 
-        self.layer = {'rnn': nn.RNN, 'lstm': nn.LSTM, 'gru': nn.GRU}[self.layer.lower()]
+        self.layer = _RNN_LAYERS[self.layer.lower()]
 
         kwargs = {'nonlinearity': self._args['act'], 'bias': self._args['b'],
                 'batch_first': self._args['batch_first'],
@@ -379,7 +386,7 @@ class _RNNBase(Node):
         # The 'nonlinearity' / 'act' argument is not a part of LSTM and GRU
         if not isinstance(self.layer, nn.RNN): kwargs.pop('nonlinearity')
 
-        self.layer = self.layer(*[self._args[k] for k in ('i', 'h', 'n')], **kwargs)
+        self.layer = self.layer(self._args['i'], self._args['h'], self._args['n'], **kwargs)
 
         super().build(x, h)
 
@@ -568,7 +575,8 @@ class BatchNorm(Node):
         self._args['i'] = x.shape[1]
 
         layer_class = self._find_layer(x) # Infer the layer (BatchNorm1D, 2D or 3D)
-        self.layer = layer_class(*[self._args[k] for k in ('i', 'e', 'm', 'a', 'track')])
+        self.layer = layer_class(self._args['i'], self._args['e'], self._args['m'],
+                                 self._args['a'], self._args['track'])
 
         super().build(x)
 
@@ -577,6 +585,5 @@ class BatchNorm(Node):
 
     @staticmethod
     def _find_layer(x):
-        shape_dict = [nn.BatchNorm1d, nn.BatchNorm1d, nn.BatchNorm2d, nn.BatchNorm3d]
         ndim = len(x.shape) - 1
-        return shape_dict[ndim - 1]
+        return _BATCH_NORM_LAYERS[ndim - 1]
@@ -1,10 +1,13 @@
 # coding=utf-8
 import torch
+import inspect
+import warnings
 import magnet as mag
 
 from torch import nn
-
-from magnet.utils.misc import caller_locals
+from pathlib import Path
+from weakref import WeakSet
+from functools import wraps
 
 class Node(nn.Module):
     r"""Abstract base class that defines MagNet's Node implementation.
@@ -27,29 +30,84 @@ class Node(nn.Module):
         This is later modified by the :py:meth:`build` method which gets
         automatically called on the first forward pass.
 
+        The constructor of every subclass is wrapped to record the arguments
+        it receives, by name, along with the defaults of the ones not given.
+        Arguments of the outer (derived) constructors take precedence.
+
+        While ``mag.build_lock`` is set, a built Node skips the build check
+        on later calls. Change the lock with :py:func:`magnet.set_build_lock`
+        so that already built Nodes follow it too.
+
         Keyword Args:
             name (str) - A printable name for this node. Default: Class Name
         """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '__init__' in cls.__dict__: cls.__init__ = _record_args(cls.__init__)
+
+    # All live Nodes. Used by mag.set_build_lock()
+    _instances = WeakSet()
+
     def __init__(self, *args, **kwargs):
         super().__init__()
-        self._parse_args()
+        self._parse_args(args, kwargs)
         self._built = False
+        self._fast = False
+        Node._instances.add(self)
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+
+        # Copies (deepcopy, pickle, torch.load) skip __init__.
+        # Register them and let the next call check the lock.
+        self._fast = False
+        Node._instances.add(self)
+
+        # nn.Module drops the compiled call when copied
+        if self.__dict__.get('_compile_mode') is not None: self._compile()
 
     def build(self, *args, **kwargs):
         r"""Builds the Node.
         Ideally, should not be called manually.
 
         When an unbuilt module is first called, this method gets invoked.
+
+        If ``mag.compile_mode`` is set, the Node is also compiled
+        with :py:meth:`torch.nn.Module.compile` (only once).
         """
         self._built = True
-        self.to(mag.device)
+
+        # Skip walking through all the tensors in to()
+        # if every parameter and buffer was already created on the device.
+        devices = {t.device for t in self.parameters()}
+        devices.update(t.device for t in self.buffers())
+
+        if len(devices) == 1 and _is_on(next(iter(devices)), mag.device): self.device = devices.pop()
+        else: self.to(mag.device)
+
+        if mag.compile_mode is not None and self.__dict__.get('_compile_mode') is None:
+            if not hasattr(nn.Module, 'compile'):
+                raise RuntimeError('mag.compile_mode needs nn.Module.compile() (PyTorch 2.2 or above). '
+                                   f'Found PyTorch {torch.__version__}.')
+
+            warnings.warn('Compiling Nodes with torch.compile(). '
+                          'The first few forward passes will be slow.')
+            self._compile_mode = mag.compile_mode
+            self._compile()
+
+    def _compile(self):
+        self.compile(mode=self._compile_mode, dynamic=True)
 
     def __call__(self, *args, **kwargs):
+        if self._fast: return nn.Module.__call__(self, *args, **kwargs)
+
         if not (self._built and mag.build_lock): self.build(*args, **kwargs)
-        return super().__call__(*args, **kwargs)
+        self._fast = self._built and mag.build_lock
+
+        return nn.Module.__call__(self, *args, **kwargs)
 
-    def _parse_args(self):
+    def _parse_args(self, args, kwargs):
         """ A Helper Method to get all the constructor arguments
         and store them into _args.
 
@@ -58,8 +116,9 @@ class Node(nn.Module):
         Additionally, this method also captures the name of the
         Node, if given (default is the class name).
         """
-        args = caller_locals(ancestor=True)
-        args.update(args.pop('kwargs', {}))
+        # Only the Node class itself takes the arguments as is
+        recorded = self.__dict__.pop('_recorded_args', None)
+        args = {'args': args, **kwargs} if recorded is None else recorded
 
         self.name = args.pop('name', self.__class__.__name__)
 
@@ -79,21 +138,16 @@ class Node(nn.Module):
 
         # Additionally, set a convinient device attribute
 
-        try: self.device = next(self.parameters())[0].device
+        try: self.device = next(self.parameters()).device
         except StopIteration: pass
 
         return self
 
     def load_state_dict(self, f):
-        from pathlib import Path
-
         # Handle a path being given instead of a file. (preferred since it
         # automatically maps to the correct device)
         if isinstance(f, (str, Path)):
-            device = self.device.type
-            if device == 'cuda': device = 'cuda:0'
-
-            return super().load_state_dict(torch.load(f, map_location=device))
+            return super().load_state_dict(torch.load(f, map_location=self.device))
         else:
             return super().load_state_dict(f)
 
@@ -121,3 +175,41 @@ class Node(nn.Module):
 
         if isinstance(n, (tuple, list)):
             return self._mul_list(n)
+
+def _record_args(init):
+    r"""Wraps a Node's constructor so that it records its arguments in
+    ``_recorded_args`` before running.
+
+    The signature is read only once per class.
+    """
+    params = list(inspect.signature(init).parameters.values())[1:] # Skip self
+    positional = [p.name for p in params if p.kind == p.POSITIONAL_OR_KEYWORD]
+    var_positional = next((p.name for p in params if p.kind == p.VAR_POSITIONAL), None)
+
+    # The recorded arguments follow the order of the signature.
+    # Required arguments which are missing make the constructor raise anyway.
+    template = {p.name: p.default for p in params if p.kind != p.VAR_KEYWORD}
+
+    @wraps(init)
+    def __init__(self, *args, **kwargs):
+        recorded = template.copy()
+        recorded.update(zip(positional, args))
+        if var_positional is not None: recorded[var_positional] = args[len(positional):]
+        recorded.update(kwargs) # Including whatever goes into **kwargs
+
+        # An outer constructor has already recorded its arguments.
+        # They override the ones recorded here.
+        outer = self.__dict__.get('_recorded_args')
+        if outer is not None: recorded.update(outer)
+        self.__dict__['_recorded_args'] = recorded
+
+        init(self, *args, **kwargs)
+
+    return __init__
+
+def _is_on(device, target):
+    target = torch.device(target)
+    if target.type == 'cuda' and target.index is None:
+        target = torch.device('cuda', torch.cuda.current_device())
+
+    return device == target
@@ -1,6 +1,7 @@
 import torch
 
 from torch import nn
+from functools import partial
 
 import magnet as mag
 from magnet.nodes.core import Lambda, Conv, Linear, RNN, LSTM, GRU, BatchNorm
@@ -20,6 +21,10 @@ class TestLambda:
         node = Lambda(fn)
         assert node.name == 'fn'
 
+    def test_partial_has_type_name(self):
+        node = Lambda(partial(pow, 2))
+        assert node.name == 'partial'
+
     def test_square(self):
         x = torch.ones(4, 1, 28, 28, device=mag.device)
 
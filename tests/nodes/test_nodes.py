@@ -1,10 +1,36 @@
+import io
+import copy
+import torch
 import pytest
 import hypothesis.strategies as st
 
 from hypothesis import given
 
+import magnet as mag
+
 from magnet.nodes import Node
 
+class _Identity(Node):
+    # Counts how many times it was built
+    builds = 0
+
+    def build(self, *args, **kwargs):
+        self.builds += 1
+        self.layer = torch.nn.Linear(1, 1).to(mag.device)
+        super().build(*args, **kwargs)
+
+    def forward(self, x):
+        return x
+
+class _Block(Node):
+    # Like the README ResBlock, p is not passed on to Node
+    def __init__(self, c=None, p='same'):
+        super().__init__(c)
+
+class _Stack(Node):
+    def __init__(self, *layers, act='relu'):
+        super().__init__(*layers)
+
 class TestNode:
     def test_not_built(self):
         node = Node()
@@ -23,6 +49,17 @@ class TestNode:
         assert node._args == {'args': tuple(args), **kwargs}
         if include_name: assert node.name == name
 
+    def test_custom_node_args(self):
+        node = _Block(3, p='half')
+        assert node._args == {'c': 3, 'p': 'half'}
+
+        nodes = node * 3
+        assert all(n._args == node._args for n in nodes)
+
+    def test_custom_node_var_args(self):
+        node = _Stack(1, 2, 3)
+        assert node._args == {'layers': (1, 2, 3), 'act': 'relu'}
+
     @given(st.one_of(st.none(), st.just('')))
     def test_name_is_not_senseless(self, name):
         with pytest.raises(ValueError):
@@ -36,6 +73,125 @@ class TestNode:
         assert nodes[0] is node
         assert all(nodes[i]._args == node._args for i in range(1, n))
 
+    def test_set_build_lock(self):
+        node = _Identity()
+        node(0)
+
+        try:
+            mag.set_build_lock(False)
+            node(0); node(0)
+            assert node.builds == 3
+        finally:
+            mag.set_build_lock(True)
+
+        node(0)
+        assert node.builds == 3 and node._fast
+
+    def test_not_locked_until_built(self):
+        builds = []
+        node = _Identity()
+        node.build = lambda *args, **kwargs: builds.append(args) # Never reaches Node.build()
+
+        node(0); node(0); node(0)
+        assert len(builds) == 3
+
+    def test_set_build_lock_on_copy(self):
+        node = _Identity()
+        node(0)
+        node_copy = copy.deepcopy(node)
+
+        assert not node_copy._fast
+        assert node_copy in Node._instances
+
+        try:
+            mag.set_build_lock(False)
+            node_copy(0)
+            assert node_copy.builds == 2
+        finally:
+            mag.set_build_lock(True)
+
+    def test_no_move_on_device(self, monkeypatch):
+        node = _Identity()
+        monkeypatch.setattr(node, 'to', None)
+        node(0)
+
+        assert node.device == node.layer.weight.device
+
+    def test_move_buffers_on_device(self, monkeypatch):
+        monkeypatch.setattr(mag, 'device', torch.device('meta'))
+
+        # The parameters get created on the device, this buffer does not
+        node = _Identity()
+        node.register_buffer('running', torch.zeros(1))
+        node(0)
+
+        assert node.running.device == torch.device('meta')
+
+    def test_load_state_dict_from_path(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(mag, 'device', torch.device('cpu'))
+
+        node = _Identity()
+        node(0)
+        path = tmp_path / 'node.pt'
+        torch.save(node.state_dict(), path)
+
+        loaded = _Identity()
+        loaded(0)
+        loaded.load_state_dict(path)
+
+        assert loaded.device == torch.device('cpu')
+        assert all(p.device == loaded.device for p in loaded.parameters())
+        assert torch.equal(loaded.layer.weight, node.layer.weight)
+
+    def test_compile_mode(self, monkeypatch):
+        compiled = []
+        def compile(fn, **kwargs):
+            compiled.append(kwargs['mode'])
+            return fn
+
+        monkeypatch.setattr(torch, 'compile', compile)
+        monkeypatch.setattr(mag, 'compile_mode', 'reduce-overhead')
+
+        node = _Identity()
+        with pytest.warns(UserWarning):
+            assert node(2) == 2
+        node.build()
+
+        assert compiled == ['reduce-overhead']
+
+    def test_compile_mode_on_copy(self, monkeypatch):
+        compiled = []
+        def compile(fn, **kwargs):
+            compiled.append(fn)
+            return fn
+
+        monkeypatch.setattr(torch, 'compile', compile)
+        monkeypatch.setattr(mag, 'compile_mode', 'default')
+
+        node = _Identity()
+        with pytest.warns(UserWarning):
+            node(0)
+
+        node_copy = copy.deepcopy(node)
+        assert node_copy(2) == 2
+        assert compiled[-1].__self__ is node_copy
+
+        buffer = io.BytesIO()
+        torch.save(node, buffer)
+        buffer.seek(0)
+        node_loaded = torch.load(buffer, weights_only=False)
+
+        assert node_loaded(2) == 2
+        assert compiled[-1].__self__ is node_loaded
+        assert len(compiled) == 3
+
+    def test_compile_mode_needs_torch_compile(self, monkeypatch):
+        monkeypatch.delattr(torch.nn.Module, 'compile')
+        monkeypatch.setattr(mag, 'compile_mode', 'default')
+
+        with pytest.raises(RuntimeError):
+            _Identity()(0)
+
     def test_print_args(self):
         node = Node(5, 2, a=1)
         assert node.get_args() == 'args=(5, 2), a=1'
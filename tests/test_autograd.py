@@ -0,0 +1,48 @@
+import os
+import torch
+import pytest
+import warnings
+
+from magnet._autograd import _set_cuda_alloc_conf, _ALLOC_CONFS
+
+@pytest.fixture
+def environ(monkeypatch):
+    for name in _ALLOC_CONFS: monkeypatch.delenv(name, raising=False)
+    monkeypatch.delenv('MAGNET_ALLOC_CONF', raising=False)
+    monkeypatch.setattr(torch.cuda, 'is_initialized', lambda: False)
+    return monkeypatch
+
+class TestCudaAllocConf:
+    def test_default(self, environ):
+        _set_cuda_alloc_conf()
+        assert os.environ['PYTORCH_CUDA_ALLOC_CONF'] == 'expandable_segments:True'
+
+    def test_magnet_alloc_conf(self, environ):
+        environ.setenv('MAGNET_ALLOC_CONF', 'max_split_size_mb:128')
+        _set_cuda_alloc_conf()
+        assert os.environ['PYTORCH_CUDA_ALLOC_CONF'] == 'max_split_size_mb:128'
+
+    def test_pytorch_alloc_conf_takes_precedence(self, environ):
+        environ.setenv('PYTORCH_CUDA_ALLOC_CONF', 'expandable_segments:False')
+        environ.setenv('MAGNET_ALLOC_CONF', 'max_split_size_mb:128')
+        _set_cuda_alloc_conf()
+        assert os.environ['PYTORCH_CUDA_ALLOC_CONF'] == 'expandable_segments:False'
+
+    @pytest.mark.parametrize('name', ['PYTORCH_ALLOC_CONF', 'PYTORCH_HIP_ALLOC_CONF'])
+    def test_other_alloc_confs_take_precedence(self, environ, name):
+        environ.setenv(name, 'expandable_segments:False')
+        _set_cuda_alloc_conf()
+        assert 'PYTORCH_CUDA_ALLOC_CONF' not in os.environ
+
+    def test_warns_only_if_asked(self, environ):
+        environ.setattr(torch.cuda, 'is_initialized', lambda: True)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            _set_cuda_alloc_conf()
+
+        environ.setenv('MAGNET_ALLOC_CONF', 'max_split_size_mb:128')
+        with pytest.warns(UserWarning):
+            _set_cuda_alloc_conf()
+
+        assert 'PYTORCH_CUDA_ALLOC_CONF' not in os.environ